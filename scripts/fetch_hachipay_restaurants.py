@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
 import argparse
 import csv
+import json
 import sys
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, Iterator, Tuple
 
 import requests
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 
@@ -14,20 +20,35 @@ API_BASE = "https://i0zhcu8mz1.execute-api.ap-northeast-1.amazonaws.com/prod/shi
 RESTAURANT_PARENT_ID = "50"
 
 
+def parse_json(response: requests.Response) -> Dict:
+    """Decode a JSON response body straight from bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
 def fetch_categories(session: requests.Session) -> Iterable[Dict]:
     response = session.get(f"{API_BASE}/shops/categories", timeout=30)
     response.raise_for_status()
-    payload = response.json()
+    payload = parse_json(response)
     if payload.get("resultCode") != 1:
         raise RuntimeError("Unexpected response while fetching categories")
     return payload.get("result", [])
 
 
-def resolve_category_name(categories: Iterable[Dict], target_id: str) -> str:
+def index_category_names(categories: Iterable[Dict]) -> Dict[str, str]:
+    # setdefault keeps the first category for a duplicated id, like the old linear search.
+    names_by_id: Dict[str, str] = {}
     for category in categories:
-        if category.get("id") == target_id:
-            return category.get("name", "")
-    raise ValueError(f"Could not find category name for id={target_id}")
+        names_by_id.setdefault(category.get("id"), category.get("name", ""))
+    return names_by_id
+
+
+def resolve_category_name(names_by_id: Dict[str, str], target_id: str) -> str:
+    try:
+        return names_by_id[target_id]
+    except KeyError:
+        raise ValueError(f"Could not find category name for id={target_id}") from None
 
 
 def fetch_restaurant_data(session: requests.Session, parent_name: str) -> Tuple[Iterable[Dict], int]:
@@ -39,7 +60,7 @@ def fetch_restaurant_data(session: requests.Session, parent_name: str) -> Tuple[
     }
     response = session.get(f"{API_BASE}/shops", params=params, timeout=30)
     response.raise_for_status()
-    payload = response.json()
+    payload = parse_json(response)
     if payload.get("resultCode") != 1:
         raise RuntimeError("Unexpected response while fetching restaurants")
     result = payload.get("result", {})
@@ -52,18 +73,28 @@ def compose_address(entry: Dict) -> str:
     if str(entry.get("addr_no_disp")) == "1":
         return ""
     if entry.get("app_pref"):
-        parts = [
-            entry.get("app_addr"),
-            entry.get("app_addr_shi"),
-            entry.get("app_addr_buil"),
-        ]
-    else:
-        parts = [
-            entry.get("addr03"),
-            entry.get("addr_shi03"),
-            entry.get("addr_buil03"),
-        ]
-    return "".join(filter(None, parts))
+        return (
+            (entry.get("app_addr") or "")
+            + (entry.get("app_addr_shi") or "")
+            + (entry.get("app_addr_buil") or "")
+        )
+    return (
+        (entry.get("addr03") or "")
+        + (entry.get("addr_shi03") or "")
+        + (entry.get("addr_buil03") or "")
+    )
+
+
+def to_csv_row(entry: Dict) -> Dict:
+    return {
+        "show_name": entry.get("show_name", ""),
+        "parent_category": entry.get("parent_category", ""),
+        "middle_category": entry.get("middle_category", ""),
+        "child_category": entry.get("child_category", ""),
+        "address": compose_address(entry),
+        "tel": entry.get("tel", ""),
+        "google_url": entry.get("google_url", ""),
+    }
 
 
 def write_csv(rows: Iterable[Dict], output_path: Path) -> int:
@@ -76,15 +107,20 @@ def write_csv(rows: Iterable[Dict], output_path: Path) -> int:
         "tel",
         "google_url",
     ]
+    written = 0
+
+    def counted(rows: Iterable[Dict]) -> Iterator[Dict]:
+        nonlocal written
+        for row in rows:
+            written += 1
+            yield row
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     with output_path.open("w", newline="", encoding="utf-8") as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
-        count = 0
-        for row in rows:
-            writer.writerow(row)
-            count += 1
-    return count
+        writer.writerows(counted(rows))
+    return written
 
 
 def main() -> None:
@@ -101,7 +137,7 @@ def main() -> None:
 
     try:
         categories = fetch_categories(session)
-        parent_name = resolve_category_name(categories, RESTAURANT_PARENT_ID)
+        parent_name = resolve_category_name(index_category_names(categories), RESTAURANT_PARENT_ID)
         raw_entries, total = fetch_restaurant_data(session, parent_name)
     except requests.HTTPError as exc:
         print(f"HTTP error: {exc}", file=sys.stderr)
@@ -113,21 +149,7 @@ def main() -> None:
         print(f"Failed to fetch restaurant data: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    csv_ready_rows = []
-    for entry in raw_entries:
-        csv_ready_rows.append(
-            {
-                "show_name": entry.get("show_name", ""),
-                "parent_category": entry.get("parent_category", ""),
-                "middle_category": entry.get("middle_category", ""),
-                "child_category": entry.get("child_category", ""),
-                "address": compose_address(entry),
-                "tel": entry.get("tel", ""),
-                "google_url": entry.get("google_url", ""),
-            }
-        )
-
-    written = write_csv(csv_ready_rows, args.output)
+    written = write_csv((to_csv_row(entry) for entry in raw_entries), args.output)
     print(f"Fetched {total} restaurants; wrote {written} rows to {args.output}")
 
 
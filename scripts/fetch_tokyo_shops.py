@@ -22,11 +22,18 @@ from typing import Iterable
 
 from fetch_shops import fetch_municipal_shops, fetch_shop_detail
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 DEFAULT_MUNICIPAL_PATH = pathlib.Path("data/municipalities.json")
 DEFAULT_OUTPUT_PATH = pathlib.Path("data/tokyo_shops.json")
 
 
 def load_municipalities(path: pathlib.Path) -> list[dict[str, object]]:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     with path.open("r", encoding="utf-8") as fh:
         return json.load(fh)
 
@@ -213,6 +220,9 @@ def write_output(data: object, path: pathlib.Path) -> None:
         "updatedAt": dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
         "data": data,
     }
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2) + b"\n")
+        return
     with path.open("w", encoding="utf-8") as fh:
         json.dump(payload, fh, ensure_ascii=False, indent=2)
         fh.write("\n")
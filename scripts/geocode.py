@@ -10,15 +10,37 @@ Outputs:
 from __future__ import annotations
 
 import argparse
+import collections
 import csv
+import gzip
 import json
 import os
+import random
+import re
 import sys
+import threading
 import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import IO, Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, TypeVar
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:  # pragma: no cover - HTTP response caching is optional
+    requests_cache = None
 
 # Base endpoints for Google Maps APIs
 GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
@@ -28,66 +50,488 @@ PLACE_SEARCH_URL_LEGACY = "https://maps.googleapis.com/maps/api/place/findplacef
 BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 DEFAULT_CACHE_PATH = DATA_DIR / "geocode_cache.json"
+DEFAULT_HTTP_CACHE_PATH = DATA_DIR / "http_cache.sqlite"
+HTTP_CACHE_EXPIRE_SECONDS = 30 * 24 * 3600
+DEFAULT_WORKERS = 8
+DEFAULT_NEGATIVE_TTL_DAYS = 30
+# Backoff for "OVER_QUERY_LIMIT" answers, which arrive as HTTP 200 and so are not
+# covered by the session's HTTP-level Retry policy.
+QUOTA_RETRY_ATTEMPTS = 5
+QUOTA_RETRY_BASE_SECONDS = 0.5
+QUOTA_RETRY_MAX_SECONDS = 30.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Places API queries to try in order, an address for the Geocoding API fallback, and
+# optionally an area name (e.g. a ward) whose location biases the Places search.
+Lookup = Tuple[List[str], Optional[str], Optional[str]]
+# Coordinates of a resolved lookup, or None if it was not found.
+LookupResult = Optional["Coord"]
+
+PLACE_KEY_PREFIX = "place:"
+PLACE_BIAS_RADIUS_METERS = 5000
+# Canonical addresses shorter than this are placeholders for "unknown" in the source
+# data ("-", "ー", "不明", ...) and are never looked up.
+MIN_ADDRESS_LENGTH = 3
+# Returned by cache lookups on a miss; None is a valid cached value ("not found").
+_MISSING: Any = object()
+_WHITESPACE_RE = re.compile(r"\s+")
+# KEY=value lines of a .env file; "#" comment lines and anything else simply don't match.
+# Horizontal whitespace only, so an empty value never runs on into the next line.
+_DOTENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value: Any, *, indent: bool = True, sort_keys: bool = False) -> bytes:
+    """Serialize ``value`` as UTF-8 JSON, 2-space indented unless ``indent`` is false."""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(value, option=option)
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        sort_keys=sort_keys,
+    ).encode("utf-8")
+
+
+@contextmanager
+def _atomic_open(path: Path, mode: str = "wb", **kwargs: Any) -> Iterator[IO]:
+    """Write to a temporary sibling of ``path``, fsync it and move it into place once complete.
+
+    A failed write leaves the previous version untouched.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with tmp_path.open(mode, **kwargs) as handle:
+            yield handle
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@lru_cache(maxsize=None)
+def canonicalize_address(text: Optional[str]) -> str:
+    """Return the interned NFKC, whitespace-collapsed form used for cache keys and API requests."""
+    return sys.intern(_WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip())
+
+
+def _is_placeholder_address(address: str) -> bool:
+    """Whether a canonical address is too short to be a real one (e.g. "-" or "不明")."""
+    return len(address) < MIN_ADDRESS_LENGTH
+
+
+def _usable_address(text: Optional[str]) -> str:
+    """Canonicalize an address from the source data, or return "" for a placeholder."""
+    address = canonicalize_address(text)
+    return "" if _is_placeholder_address(address) else address
+
 
+def _canonical_cache_key(key: str) -> str:
+    if key.startswith(PLACE_KEY_PREFIX):
+        return sys.intern(PLACE_KEY_PREFIX + canonicalize_address(key[len(PLACE_KEY_PREFIX):]))
+    return canonicalize_address(key)
 
-def _normalize_coords(value: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a shallow copy containing float lat/lng and optional place_id."""
 
-    lat = float(value["lat"])
-    lng = float(value["lng"])
-    normalized: Dict[str, Any] = {"lat": lat, "lng": lng}
-    place_id = value.get("place_id")
-    if place_id:
-        normalized["place_id"] = str(place_id)
-    return normalized
+class Coord(NamedTuple):
+    """A resolved location; ``place_id`` is None when only coordinates are known."""
+
+    lat: float
+    lng: float
+    place_id: Optional[str] = None
+
+    @classmethod
+    def from_json(cls, value: Dict[str, Any]) -> "Coord":
+        place_id = value.get("place_id")
+        return cls(float(value["lat"]), float(value["lng"]), str(place_id) if place_id else None)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """The JSON form stored in the cache: lat/lng, plus place_id when known."""
+        value: Dict[str, Any] = {"lat": self.lat, "lng": self.lng}
+        if self.place_id:
+            value["place_id"] = self.place_id
+        return value
 
 
 class GeocodeError(RuntimeError):
     """Custom error raised when the geocoding API returns an unexpected status."""
 
 
-def load_cache(path: Path) -> Dict[str, Optional[Dict[str, Any]]]:
+class RateLimiter:
+    """Space out requests to each API endpoint so they start ``interval`` seconds apart across threads.
+
+    An endpoint that has been idle may start up to ``burst`` requests at once.
+    """
+
+    def __init__(self, interval: float, *, burst: int = 1) -> None:
+        self._interval = max(interval, 0.0)
+        self._tolerance = (max(burst, 1) - 1) * self._interval
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until the caller may issue its request to ``endpoint``."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            arrival = max(now, self._next_allowed.get(endpoint, 0.0))
+            start = max(now, arrival - self._tolerance)
+            self._next_allowed[endpoint] = arrival + self._interval
+        if start > now:
+            time.sleep(start - now)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """HTTPAdapter that paces outgoing requests per endpoint through a ``RateLimiter``.
+
+    Responses replayed from the HTTP cache never reach it, so they are not throttled.
+    """
+
+    def __init__(self, limiter: Optional[RateLimiter] = None, **kwargs: Any) -> None:
+        self._limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if self._limiter is not None:
+            self._limiter.acquire((request.url or "").split("?", 1)[0])
+        return super().send(request, **kwargs)
+
+
+class LookupProgress:
+    """Single-line "done/total found/missing" counter for a batch of API lookups.
+
+    Off a terminal only the final line is printed.
+    """
+
+    def __init__(self, label: str, total: int, *, stream: Any = None, interval: float = 0.2) -> None:
+        self._label = label
+        self._total = total
+        self._stream = stream or sys.stdout
+        self._interval = interval
+        self._inline = self._stream.isatty()
+        self._last_draw = 0.0
+        self.done = 0
+        self.found = 0
+
+    def advance(self, found: bool) -> None:
+        self.done += 1
+        self.found += found
+        if self._inline and time.monotonic() - self._last_draw >= self._interval:
+            self._draw()
+
+    def close(self) -> None:
+        self._draw()
+        self._stream.write("\n")
+        self._stream.flush()
+
+    def _draw(self) -> None:
+        self._last_draw = time.monotonic()
+        missing = self.done - self.found
+        prefix = "\r" if self._inline else ""
+        self._stream.write(
+            f"{prefix}   {self._label}: {self.done}/{self._total} (found {self.found}, missing {missing})"
+        )
+        self._stream.flush()
+
+
+def _print_summary(
+    label: str, found_place_id: int, found_coords_only: int, not_found: int, processed: int
+) -> None:
+    print(f"\n📊 {label} summary:")
+    print(f"   ✓ Place ID found:    {found_place_id}")
+    print(f"   ~ Coordinates only:  {found_coords_only}")
+    print(f"   ✗ Not found:         {not_found}")
+    print(f"   Total processed:     {processed}")
+
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T], workers: int) -> Iterator[R]:
+    """Yield ``func(item)`` for each item in order, running up to ``workers`` calls at once."""
+    workers = max(workers, 1)
+    window = workers * 4
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: collections.deque = collections.deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class CacheJournal:
+    """Append-only JSONL log of cache entries, replayed by ``load_cache`` and emptied by ``save_cache``."""
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle = path.open("ab")
+
+    def append(self, key: str, value: Dict[str, Any]) -> None:
+        self._handle.write(_json_dumps({key: value}, indent=False) + b"\n")
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class GeocodeCache(Dict[str, Optional[Coord]]):
+    """Address/query → coords mapping shared by the worker threads; ``None`` means "not found".
+
+    Add entries with ``remember`` so that they are journaled and misses are timestamped.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.journal: Optional[CacheJournal] = None
+        self.miss_times: Dict[str, int] = {}  # when each "not found" was looked up
+        self.dirty = False  # changed since last loaded or saved
+        self.pretty: Optional[bool] = None  # whether the snapshot on disk is indented, if known
+
+    def __setitem__(self, key: str, value: Optional[Coord]) -> None:
+        super().__setitem__(key, value)
+        self.dirty = True
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self.dirty = True
+
+    def clear(self) -> None:
+        super().clear()
+        self.miss_times.clear()
+        self.dirty = True
+
+    def remember(self, key: str, value: Optional[Coord]) -> None:
+        with self.lock:
+            self[key] = value
+            if value is None:
+                self.miss_times[key] = int(time.time())
+            else:
+                self.miss_times.pop(key, None)
+            if self.journal is not None:
+                self.journal.append(key, self.stored_value(key))
+
+    def stored_value(self, key: str) -> Dict[str, Any]:
+        """The JSON form of an entry: its coords, or a timestamped miss marker."""
+        value = self[key]
+        if value is None:
+            return {"miss": True, "ts": self.miss_times.get(key, int(time.time()))}
+        return value.as_dict()
+
+    def to_json(self) -> Dict[str, Dict[str, Any]]:
+        return {key: self.stored_value(key) for key in self}
+
+
+def journal_path(cache_path: Path) -> Path:
+    if cache_path.suffix == ".gz":
+        cache_path = cache_path.with_suffix("")
+    return cache_path.with_suffix(".jsonl")
+
+
+def _read_snapshot(path: Path) -> bytes:
     if not path.exists():
-        return {}
+        return b"{}"
+    data = path.read_bytes()
+    # Sniff the gzip magic number rather than trusting the file name.
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    return data
+
+
+def _read_journal(path: Path) -> Iterator[Dict[str, Any]]:
+    with path.open("rb") as handle:
+        for line in handle:
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                # A crash mid-append leaves a truncated last line behind.
+                continue
+
+
+def load_cache(path: Path, *, negative_ttl: Optional[float] = None) -> GeocodeCache:
+    """Load the cache snapshot plus journal; misses older than ``negative_ttl`` seconds are dropped."""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Only keep address entries that look like coordinate dicts or null
-        return {
-            addr: value if value is None else _normalize_coords(value)
-            for addr, value in data.items()
-        }
-    except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+        raw = _read_snapshot(path)
+        data = _json_loads(raw)
+        # Compact snapshots are a single line; an empty one looks the same either way.
+        pretty = b"\n" in raw if data else None
+        del raw
+        # Replayed journal entries, migrated keys, upgraded nulls and expired misses
+        # all mean the snapshot is out of date.
+        stale = False
+        journal = journal_path(path)
+        if journal.exists():
+            for entry in _read_journal(journal):
+                data.update(entry)
+                stale = True
+        cache = GeocodeCache()
+        now = int(time.time())
+        for raw_key, value in data.items():
+            # Older caches used raw strings as keys; fold variants onto one entry,
+            # preferring a hit over a miss.
+            key = _canonical_cache_key(raw_key)
+            if key != raw_key:
+                stale = True
+            if value is None or value.get("miss"):
+                if key in cache:
+                    continue
+                # Bare nulls predate miss timestamps; their TTL starts now.
+                if not value or "ts" not in value:
+                    stale = True
+                looked_up = int(value.get("ts", now)) if value else now
+                if negative_ttl is not None and now - looked_up >= negative_ttl:
+                    stale = True
+                    continue  # expired; look it up again
+                cache[key] = None
+                cache.miss_times[key] = looked_up
+            else:
+                # Only keep address entries that look like coordinate dicts
+                cache[key] = Coord.from_json(value)
+                cache.miss_times.pop(key, None)
+        del data
+        cache.dirty = stale
+        cache.pretty = pretty
+        return cache
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError, gzip.BadGzipFile, EOFError) as exc:
         raise GeocodeError(f"Failed to load cache file {path}: {exc}") from exc
 
 
-def save_cache(path: Path, cache: Dict[str, Optional[Dict[str, Any]]]) -> None:
+def save_cache(path: Path, cache: GeocodeCache, *, pretty: bool = False) -> None:
+    """Write the cache snapshot: compact, or sorted and indented if ``pretty``; gzipped for a ``.gz`` path."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+    data = _json_dumps(cache.to_json(), indent=pretty, sort_keys=pretty)
+    if path.suffix == ".gz":
+        # Fast compression is plenty for JSON; a fixed mtime keeps unchanged caches byte-identical.
+        data = gzip.compress(data, compresslevel=1, mtime=0)
+    # A truncated snapshot would make load_cache fail and lose every cached lookup.
+    with _atomic_open(path) as handle:
+        handle.write(data)
+    cache.dirty = False
+    cache.pretty = pretty if cache else None
+    # Everything in the journal is now part of the snapshot.
+    journal = journal_path(path)
+    if journal.exists():
+        journal.write_bytes(b"")
+
+
+def _is_cacheable_response(response: requests.Response) -> bool:
+    """Keep real API answers in the HTTP cache, but not quota or permission errors."""
+    try:
+        payload = _json_loads(response.content)
+    except ValueError:
+        return False
+    # Places API (New) reports errors via HTTP status only, so it has no "status" field.
+    status = payload.get("status") if isinstance(payload, dict) else None
+    return status is None or status in {"OK", "ZERO_RESULTS", "NOT_FOUND"}
+
+
+def create_session(
+    http_cache_path: Optional[Path],
+    *,
+    workers: int,
+    limiter: Optional[RateLimiter] = None,
+    expire_after: float = HTTP_CACHE_EXPIRE_SECONDS,
+) -> requests.Session:
+    """Return an HTTP session that replays cached responses when requests-cache is installed."""
+    session = _create_base_session(http_cache_path, expire_after=expire_after)
+    # Retry connection errors, rate limiting and transient server errors with
+    # exponential backoff instead of failing the lookup. Places (New) searches are
+    # read-only POSTs, so POST is safe to retry too.
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    # Keep one reusable keep-alive connection per worker and host; the default pool
+    # of 10 would drop and re-handshake connections once more workers are busy.
+    adapter = RateLimitedAdapter(limiter, pool_maxsize=max(workers, DEFAULT_POOLSIZE), max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_json(
+    session: requests.Session,
+    url: str,
+    params: Dict[str, Any],
+) -> Tuple[requests.Response, Optional[Dict[str, Any]]]:
+    """GET a Maps web service endpoint, backing off while it reports OVER_QUERY_LIMIT.
+
+    Returns the response and its decoded payload (None for non-200 responses).
+    """
+    attempt = 0
+    while True:
+        response = session.get(url, params=params, timeout=15)
+        if response.status_code != 200:
+            return response, None
+        payload = _json_loads(response.content)
+        attempt += 1
+        if payload.get("status") != "OVER_QUERY_LIMIT" or attempt >= QUOTA_RETRY_ATTEMPTS:
+            return response, payload
+        delay = QUOTA_RETRY_BASE_SECONDS * 2 ** (attempt - 1) + random.random() * 0.1
+        time.sleep(min(delay, QUOTA_RETRY_MAX_SECONDS))
+
+
+def _create_base_session(http_cache_path: Optional[Path], *, expire_after: float) -> requests.Session:
+    if http_cache_path is None or requests_cache is None:
+        return requests.Session()
+
+    http_cache_path.parent.mkdir(parents=True, exist_ok=True)
+    return requests_cache.CachedSession(
+        http_cache_path,
+        backend="sqlite",
+        expire_after=expire_after,
+        allowable_methods=("GET", "POST"),
+        # POST bodies are part of the key by default; the field mask decides the response shape.
+        match_headers=["X-Goog-FieldMask"],
+        # Keep the API key out of both the cache key and the stored requests.
+        ignored_parameters=["key", "X-Goog-Api-Key"],
+        filter_fn=_is_cacheable_response,
+    )
 
 
 def load_dotenv_file(path: Path) -> None:
     """Populate missing environment variables from a .env file."""
 
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return
 
-    with path.open("r", encoding="utf-8") as handle:
-        for raw_line in handle:
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            if not key:
-                continue
-            value = value.strip()
-            if value.startswith(("'", '"')) and value.endswith(value[0]):
-                value = value[1:-1]
-            os.environ.setdefault(key, value)
+    for key, value in _read_dotenv(str(path), mtime).items():
+        os.environ.setdefault(key, value)
+
+
+@lru_cache(maxsize=8)
+def _read_dotenv(path: str, mtime: int) -> Dict[str, str]:
+    """Parse a .env file; memoized per path and modification time."""
+    values: Dict[str, str] = {}
+    with open(path, "r", encoding="utf-8") as handle:
+        text = handle.read()
+    for key, value in _DOTENV_LINE_RE.findall(text):
+        if value[:1] in ("'", '"') and value.endswith(value[0]):
+            value = value[1:-1]
+        # Like setdefault on the environment, the first definition of a key wins.
+        values.setdefault(key, value)
+    return values
 
 
 def find_place_new(
@@ -96,26 +540,36 @@ def find_place_new(
     api_key: str,
     *,
     language: str = "ja",
-    throttle: float = 0.25,
-) -> Optional[Dict[str, Any]]:
-    """Use Places API (New) to find a place. Returns {'lat', 'lng', 'place_id'} or None."""
+    location_bias: Optional[Coord] = None,
+) -> Optional[Coord]:
+    """Use Places API (New) to find a place. Returns a Coord with place_id, or None.
+
+    Raises GeocodeError if the request fails, so that a failure is not mistaken for "not found".
+    """
     headers = {
         "Content-Type": "application/json",
         "X-Goog-Api-Key": api_key,
         "X-Goog-FieldMask": "places.id,places.location",
     }
 
-    body = {
+    body: Dict[str, Any] = {
         "textQuery": query,
         "languageCode": language,
     }
+    if location_bias:
+        body["locationBias"] = {
+            "circle": {
+                "center": {"latitude": location_bias.lat, "longitude": location_bias.lng},
+                "radius": float(PLACE_BIAS_RADIUS_METERS),
+            }
+        }
 
     response = session.post(PLACE_SEARCH_URL_NEW, json=body, headers=headers, timeout=15)
 
     if response.status_code != 200:
-        return None
+        raise GeocodeError(f"Places API (New) request failed with HTTP {response.status_code}")
 
-    payload = response.json()
+    payload = _json_loads(response.content)
     places = payload.get("places", [])
 
     if places:
@@ -124,13 +578,7 @@ def find_place_new(
         place_id = place.get("id", "").replace("places/", "")
 
         if location and place_id:
-            if throttle:
-                time.sleep(throttle)
-            return {
-                "lat": float(location["latitude"]),
-                "lng": float(location["longitude"]),
-                "place_id": str(place_id),
-            }
+            return Coord(float(location["latitude"]), float(location["longitude"]), str(place_id))
     return None
 
 
@@ -140,9 +588,12 @@ def find_place_legacy(
     api_key: str,
     *,
     language: str = "ja",
-    throttle: float = 0.25,
-) -> Optional[Dict[str, Any]]:
-    """Use Places API (Legacy) to find a place. Returns {'lat', 'lng', 'place_id'} or None."""
+    location_bias: Optional[Coord] = None,
+) -> Optional[Coord]:
+    """Use Places API (Legacy) to find a place. Returns a Coord with place_id, or None.
+
+    Raises GeocodeError if the request fails or is refused.
+    """
     params = {
         "input": query,
         "inputtype": "textquery",
@@ -150,25 +601,21 @@ def find_place_legacy(
         "key": api_key,
         "language": language,
     }
+    if location_bias:
+        params["locationbias"] = f"circle:{PLACE_BIAS_RADIUS_METERS}@{location_bias.lat},{location_bias.lng}"
 
-    response = session.get(PLACE_SEARCH_URL_LEGACY, params=params, timeout=15)
-
-    if response.status_code != 200:
-        return None
+    response, payload = _get_json(session, PLACE_SEARCH_URL_LEGACY, params)
+    if payload is None:
+        raise GeocodeError(f"Places API (Legacy) request failed with HTTP {response.status_code}")
 
-    payload = response.json()
     status = payload.get("status")
+    if status not in {"OK", "ZERO_RESULTS", "NOT_FOUND"}:
+        raise GeocodeError(f"Places API (Legacy) returned {status}: {payload.get('error_message', '')}")
 
     if status == "OK" and payload.get("candidates"):
         candidate = payload["candidates"][0]
         location = candidate["geometry"]["location"]
-        if throttle:
-            time.sleep(throttle)
-        return {
-            "lat": float(location["lat"]),
-            "lng": float(location["lng"]),
-            "place_id": str(candidate["place_id"]),
-        }
+        return Coord(float(location["lat"]), float(location["lng"]), str(candidate["place_id"]))
     return None
 
 
@@ -176,83 +623,122 @@ def find_place(
     query: str,
     session: requests.Session,
     api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
+    cache: GeocodeCache,
     *,
     language: str = "ja",
-    throttle: float = 0.25,
-) -> Optional[Dict[str, Any]]:
-    """Try both Places APIs to find a place. Returns {'lat', 'lng', 'place_id'}."""
+    location_bias: Optional[Coord] = None,
+) -> Optional[Coord]:
+    """Try both Places APIs to find a place. Returns a Coord with place_id, or None.
+
+    ``location_bias`` prefers results within ``PLACE_BIAS_RADIUS_METERS`` of it.
+    """
+    query = canonicalize_address(query)
     if not query:
         return None
 
-    cache_key = f"place:{query}"
-    if cache_key in cache:
-        return cache[cache_key]
+    cache_key = _place_cache_key(query, location_bias)
+    with cache.lock:
+        cached = cache.get(cache_key, _MISSING)
+    if cached is not _MISSING:
+        return cached
 
     result = None
+    answered = False
 
     # Try new API first
     try:
-        result = find_place_new(query, session, api_key, language=language, throttle=throttle)
+        result = find_place_new(
+            query, session, api_key, language=language, location_bias=location_bias
+        )
+        answered = True
     except Exception:
         pass
 
     # Fallback to legacy API
     if not result:
         try:
-            result = find_place_legacy(query, session, api_key, language=language, throttle=throttle)
+            result = find_place_legacy(
+                query, session, api_key, language=language, location_bias=location_bias
+            )
         except Exception:
-            pass
+            # Keys without the legacy API get REQUEST_DENIED here; a "no match" from
+            # Places (New) is still a real answer. Only when neither API answered is the
+            # query left uncached so that the next run retries it.
+            if not answered:
+                return None
 
-    cache[cache_key] = result
+    cache.remember(cache_key, result)
     return result
 
 
+def _place_cache_key(query: str, location_bias: Optional[Coord] = None) -> str:
+    # A biased search can return a different place, so the bias is part of the key.
+    if location_bias is None:
+        return f"{PLACE_KEY_PREFIX}{query}"
+    return f"{PLACE_KEY_PREFIX}{query} @{location_bias.lat:.5f},{location_bias.lng:.5f}"
+
+
+def _cached_place(cache: GeocodeCache, query: str, location_bias: Optional[Coord] = None) -> Any:
+    """The cached ``find_place`` answer for a canonical ``query``, or ``_MISSING``."""
+    return cache.get(_place_cache_key(query, location_bias), _MISSING)
+
+
+def _cached_address(cache: GeocodeCache, address: str, refresh_missing_place_id: bool) -> Any:
+    """The cached ``geocode_address`` answer for a canonical ``address``, or ``_MISSING``."""
+    cached = cache.get(address, _MISSING)
+    if cached and refresh_missing_place_id and not cached.place_id:
+        return _MISSING
+    return cached
+
+
 def geocode_address(
     address: str,
     session: requests.Session,
     api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
+    cache: GeocodeCache,
     *,
     region: str = "jp",
     language: str = "ja",
-    throttle: float = 0.25,
-) -> Optional[Dict[str, Any]]:
-    """Return {'lat', 'lng', 'place_id'?} for an address or None if not found."""
-    if not address:
+    refresh_missing_place_id: bool = False,
+) -> Optional[Coord]:
+    """Return the Coord (place_id if known) for an address in ``region`` or None if not found.
+
+    Cached entries without a place_id are only re-fetched when
+    ``refresh_missing_place_id`` is set.
+    """
+    address = canonicalize_address(address)
+    if _is_placeholder_address(address):
         return None
 
-    if address in cache:
-        cached = cache[address]
-        if cached is None or cached.get("place_id"):
-            return cached
-        # Older cache entry is missing place_id; fall through to refresh it.
+    with cache.lock:
+        # An older entry without place_id falls through here when it should be refreshed.
+        cached = _cached_address(cache, address, refresh_missing_place_id)
+    if cached is not _MISSING:
+        return cached
 
     params = {
         "address": address,
         "key": api_key,
         "region": region,
         "language": language,
+        # region only biases results; the component filter rules out matches abroad.
+        "components": f"country:{region.upper()}",
     }
 
-    response = session.get(GEOCODE_URL, params=params, timeout=15)
-    if response.status_code != 200:
+    response, payload = _get_json(session, GEOCODE_URL, params)
+    if payload is None:
         raise GeocodeError(f"Geocoding request failed with HTTP {response.status_code}: {response.text}")
 
-    payload = response.json()
+    # Only status and the first result's location and place_id are read from the payload.
     status = payload.get("status")
+    coords: Optional[Coord]
     if status == "OK":
         result = payload["results"][0]
         location = result["geometry"]["location"]
-        cache[address] = {
-            "lat": float(location["lat"]),
-            "lng": float(location["lng"]),
-        }
         place_id = result.get("place_id")
-        if place_id:
-            cache[address]["place_id"] = str(place_id)
+        coords = Coord(float(location["lat"]), float(location["lng"]), str(place_id) if place_id else None)
     elif status in {"ZERO_RESULTS", "NOT_FOUND"}:
-        cache[address] = None
+        coords = None
     elif status in {"OVER_DAILY_LIMIT", "OVER_QUERY_LIMIT", "REQUEST_DENIED"}:
         message = payload.get("error_message", "")
         raise GeocodeError(f"Geocoding quota or permission issue ({status}): {message}")
@@ -260,20 +746,154 @@ def geocode_address(
         message = payload.get("error_message", "")
         raise GeocodeError(f"Unexpected geocoding status {status}: {message}")
 
-    # Gentle throttle to avoid hitting rate limits
-    if throttle:
-        time.sleep(throttle)
+    cache.remember(address, coords)
+    return coords
+
+
+def resolve_lookups(
+    lookups: List[Lookup],
+    session: requests.Session,
+    api_key: str,
+    cache: GeocodeCache,
+    *,
+    workers: int,
+    refresh_missing_place_id: bool = False,
+) -> List[LookupResult]:
+    """Resolve lookups to their coords (None if not found), in order, fetching each unique key once."""
+
+    def run_stage(
+        label: str,
+        func: Callable[[Any], Optional[Coord]],
+        keys: List[Hashable],
+        cached: Callable[[Any], Any],
+    ) -> Dict[Any, Optional[Coord]]:
+        resolved: Dict[Any, Optional[Coord]] = {}
+        misses: List[Hashable] = []
+        add_miss = misses.append
+        for key in keys:
+            coords = cached(key)
+            if coords is _MISSING:
+                add_miss(key)
+            else:
+                resolved[key] = coords
+        if not keys:
+            return resolved
+        print(f"   {label}: {len(keys) - len(misses)} cached, {len(misses)} to fetch")
+        if not misses:
+            return resolved
+
+        # Only cache misses go to the worker pool.
+        progress = LookupProgress(label, len(misses))
+        try:
+            for key, coords in zip(misses, map_concurrently(func, misses, workers)):
+                resolved[key] = coords
+                progress.advance(coords is not None)
+        finally:
+            progress.close()
+        return resolved
+
+    # Canonicalize up front so that spelling variants are deduplicated too, and
+    # drop placeholder addresses so they never reach the Geocoding API.
+    canonical_lookups: List[Lookup] = []
+    for queries, address, bias_area in lookups:
+        address = canonicalize_address(address)
+        canonical_lookups.append((
+            [canonicalize_address(query) for query in queries],
+            None if _is_placeholder_address(address) else address,
+            canonicalize_address(bias_area) or None,
+        ))
+    lookups = canonical_lookups
+    results: List[LookupResult] = [None] * len(lookups)
+    pending = list(range(len(lookups)))
+
+    # Geocode each bias area once; all of its lookups share the result.
+    areas = list(dict.fromkeys(area for queries, _, area in lookups if queries and area))
+    area_coords = run_stage(
+        "Geocoding API (search areas)",
+        lambda area: geocode_address(area, session, api_key, cache),
+        areas,
+        lambda area: _cached_address(cache, area, False),
+    )
+    biases = [area_coords.get(area) if area else None for _, _, area in lookups]
+
+    # Stage N tries the Nth query of every lookup that is still unresolved.
+    depth = max((len(queries) for queries, _, _ in lookups), default=0)
+    for position in range(depth):
+        keys = list(dict.fromkeys(
+            (lookups[i][0][position], biases[i]) for i in pending if position < len(lookups[i][0])
+        ))
+        found = run_stage(
+            f"Places API (query {position + 1})",
+            lambda key: find_place(key[0], session, api_key, cache, location_bias=key[1]),
+            keys,
+            lambda key: _cached_place(cache, *key),
+        )
+        still_pending = []
+        for i in pending:
+            lookup_queries = lookups[i][0]
+            coords = found.get((lookup_queries[position], biases[i])) if position < len(lookup_queries) else None
+            if coords:
+                results[i] = coords
+            else:
+                still_pending.append(i)
+        pending = still_pending
+
+    # Fallback to Geocoding API for whatever the Places API could not find
+    addresses = list(dict.fromkeys(lookups[i][1] for i in pending if lookups[i][1]))
+    geocoded = run_stage(
+        "Geocoding API",
+        lambda address: geocode_address(
+            address,
+            session,
+            api_key,
+            cache,
+            refresh_missing_place_id=refresh_missing_place_id,
+        ),
+        addresses,
+        lambda address: _cached_address(cache, address, refresh_missing_place_id),
+    )
+    for i in pending:
+        address = lookups[i][1]
+        if address:
+            results[i] = geocoded[address]
+    return results
+
 
-    return cache[address]
+@dataclass
+class DatasetPlan:
+    """The lookups one dataset needs, and how to write its output once they are resolved."""
 
+    lookups: List[Lookup]
+    write_results: Callable[[List[LookupResult]], None]
 
-def process_restaurants(
+
+def run_plans(
+    plans: List[DatasetPlan],
     session: requests.Session,
     api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
+    cache: GeocodeCache,
     *,
-    throttle: float,
+    workers: int,
+    refresh_missing_place_id: bool = False,
 ) -> None:
+    """Resolve the lookups of every plan as a single batch, then write each dataset."""
+    lookups = [lookup for plan in plans for lookup in plan.lookups]
+    results = resolve_lookups(
+        lookups,
+        session,
+        api_key,
+        cache,
+        workers=workers,
+        refresh_missing_place_id=refresh_missing_place_id,
+    )
+    offset = 0
+    for plan in plans:
+        end = offset + len(plan.lookups)
+        plan.write_results(results[offset:end])
+        offset = end
+
+
+def plan_restaurants() -> DatasetPlan:
     input_path = DATA_DIR / "restaurants.csv"
     output_path = DATA_DIR / "restaurants_geocoded.csv"
 
@@ -283,57 +903,72 @@ def process_restaurants(
     print(f"\n📍 Processing restaurants from {input_path.name}")
 
     with input_path.open("r", encoding="utf-8", newline="") as f_in:
-        reader = csv.DictReader(f_in)
-        fieldnames = list(reader.fieldnames or [])
+        reader = csv.reader(f_in)
+        header = next(reader, [])
+        fieldnames = list(header)
         for extra_field in ("latitude", "longitude", "google_place_id"):
             if extra_field not in fieldnames:
                 fieldnames.append(extra_field)
-        rows = list(reader)
+        # Rows are kept as lists, cut or padded to the output width once so that every
+        # column can be read and assigned by position.
+        width = len(fieldnames)
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # blank line
+            del row[len(header):]
+            row.extend([""] * (width - len(row)))
+            rows.append(row)
+
+    col = {name: index for index, name in enumerate(fieldnames)}
+    show_name_col, name_col, address_col = col.get("show_name"), col.get("name"), col.get("address")
+    lat_col, lng_col, place_id_col = col["latitude"], col["longitude"], col["google_place_id"]
+
+    def cell(row: List[str], index: Optional[int]) -> str:
+        return row[index] if index is not None else ""
 
     total = len(rows)
-    print(f"   Total restaurants: {total}\n")
-
-    with output_path.open("w", encoding="utf-8", newline="") as f_out:
-        writer = csv.DictWriter(f_out, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for idx, row in enumerate(rows, 1):
-            name = row.get("show_name") or row.get("name") or "Unknown"
-            address = row.get("address", "").strip()
-            print(f"   [{idx}/{total}] {name[:50]:<50}", end=" ", flush=True)
-
-            # Try Places API first with name + address for accurate Place ID
-            coords = None
-            used_places_api = False
-            if name and name != "Unknown" and address:
-                query = f"{name} {address}"
-                coords = find_place(query, session, api_key, cache, throttle=throttle)
-                used_places_api = coords is not None
-
-            # Fallback to Geocoding API if Places API fails
-            if not coords and address:
-                coords = geocode_address(address, session, api_key, cache, throttle=throttle)
-
-            row["latitude"] = coords["lat"] if coords else ""
-            row["longitude"] = coords["lng"] if coords else ""
-            row["google_place_id"] = coords.get("place_id", "") if coords else ""
-            writer.writerow(row)
+    print(f"   Total restaurants: {total}")
+
+    lookups: List[Lookup] = []
+    for row in rows:
+        name = cell(row, show_name_col) or cell(row, name_col) or "Unknown"
+        address = _usable_address(cell(row, address_col))
+        # Try Places API first with name + address for accurate Place ID,
+        # falling back to the Geocoding API with the address alone
+        queries = [f"{name} {address}"] if name and name != "Unknown" and address else []
+        lookups.append((queries, address or None, None))
+
+    def write_results(results: List[LookupResult]) -> None:
+        found_place_id = 0
+        found_coords_only = 0
+        not_found = 0
+        for row, coords in zip(rows, results):
+            row[lat_col] = coords.lat if coords else ""
+            row[lng_col] = coords.lng if coords else ""
+            row[place_id_col] = (coords.place_id or "") if coords else ""
 
             if coords:
-                if coords.get("place_id"):
-                    print(f"✓ {'[Places API]' if used_places_api else '[Geocoding]'}")
+                if coords.place_id:
+                    found_place_id += 1
                 else:
-                    print("~ (coords only)")
+                    found_coords_only += 1
             else:
-                print("✗ (not found)")
+                not_found += 1
 
-    print(f"\n✅ Saved to {output_path.name}\n")
+        # Write once geocoding is done so a failed run never leaves a half-written file behind.
+        with _atomic_open(output_path, "w", encoding="utf-8", newline="", buffering=1 << 20) as f_out:
+            writer = csv.writer(f_out)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
 
+        _print_summary("Restaurants", found_place_id, found_coords_only, not_found, total)
+        print(f"\n✅ Saved to {output_path.name}\n")
 
-def process_shops(
-    session: requests.Session,
-    api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
+    return DatasetPlan(lookups, write_results)
+
+
+def plan_shops(
     *,
     input_filename: str,
     output_filename: str,
@@ -342,15 +977,17 @@ def process_shops(
     name_extractor,
     query_builder,
     coord_setter,
-    throttle: float,
-) -> None:
-    """Generic shop geocoding function.
+    bias_area_builder=None,
+) -> DatasetPlan:
+    """Plan geocoding for a generic shop dataset.
 
     Args:
         shop_extractor: Function that takes data dict and yields (shop, group_name) tuples
         name_extractor: Function that takes shop dict and returns name string
         query_builder: Function that takes (name, shop) and returns query string or list of query strings
         coord_setter: Function that takes (shop, coords) and sets lat/lng/place_id fields
+        bias_area_builder: Optional function that takes (shop, group_name) and returns an
+            area name whose location should bias the Places search, or None
     """
     input_path = DATA_DIR / input_filename
     output_path = DATA_DIR / output_filename
@@ -358,35 +995,19 @@ def process_shops(
     if not input_path.exists():
         raise FileNotFoundError(f"Missing input file: {input_path}")
 
-    data = json.loads(input_path.read_text(encoding="utf-8"))
+    data = _json_loads(input_path.read_bytes())
 
     # Count total shops
     shops_list = list(shop_extractor(data))
     total_shops = len(shops_list)
     print(f"\n🏪 Processing {city_name} shops from {input_path.name}")
-    print(f"   Total shops: {total_shops}\n")
-
-    processed = 0
-    found_place_id = 0
-    found_coords_only = 0
-    not_found = 0
-    current_group = None
+    print(f"   Total shops: {total_shops}")
 
+    lookups: List[Lookup] = []
     for shop, group_name in shops_list:
-        processed += 1
-
-        # Print group header if changed
-        if group_name and group_name != current_group:
-            print(f"   📍 {group_name}")
-            current_group = group_name
-
         name = name_extractor(shop)
-        indent = "      " if group_name else "   "
-        print(f"{indent}[{processed}/{total_shops}] {name[:45]:<45}", end=" ", flush=True)
-
         if not name:
-            print("✗ (no name)")
-            not_found += 1
+            lookups.append(([], None, None))
             continue
 
         # Build query (can be string or list of strings for fallback)
@@ -394,52 +1015,40 @@ def process_shops(
         if isinstance(queries, str):
             queries = [queries]
 
-        # Try each query
-        coords = None
-        used_places_api = False
-        for query in queries:
-            coords = find_place(query, session, api_key, cache, throttle=throttle)
-            if coords:
-                used_places_api = True
-                break
-
         # Fallback to Geocoding API if Places API fails and address is available
-        if not coords:
-            address = shop.get("details", {}).get("住所") if "details" in shop else None
-            if address:
-                coords = geocode_address(address, session, api_key, cache, throttle=throttle)
+        address = _usable_address(shop.get("details", {}).get("住所"))
+        bias_area = bias_area_builder(shop, group_name) if bias_area_builder else None
+        lookups.append(([query for query in queries if query], address or None, bias_area))
+
+    def write_results(results: List[LookupResult]) -> None:
+        found_place_id = 0
+        found_coords_only = 0
+        not_found = 0
+        for (shop, _), coords in zip(shops_list, results):
+            if not name_extractor(shop):
+                not_found += 1
+                continue
 
-        if coords:
-            coord_setter(shop, coords)
-            place_id = coords.get("place_id")
-            if place_id:
-                print(f"✓ {'[Places API]' if used_places_api else '[Geocoding]'}")
-                found_place_id += 1
+            if coords:
+                coord_setter(shop, coords)
+                if coords.place_id:
+                    found_place_id += 1
+                else:
+                    found_coords_only += 1
             else:
-                print("~ (coords only)")
-                found_coords_only += 1
-        else:
-            coord_setter(shop, None)
-            print("✗ (not found)")
-            not_found += 1
+                coord_setter(shop, None)
+                not_found += 1
 
-    output_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        with _atomic_open(output_path) as f_out:
+            f_out.write(_json_dumps(data))
 
-    print(f"\n📊 Summary:")
-    print(f"   ✓ Place ID found:    {found_place_id}")
-    print(f"   ~ Coordinates only:  {found_coords_only}")
-    print(f"   ✗ Not found:         {not_found}")
-    print(f"   Total processed:     {processed}")
-    print(f"\n✅ Saved to {output_path.name}\n")
+        _print_summary(f"{city_name} shops", found_place_id, found_coords_only, not_found, total_shops)
+        print(f"\n✅ Saved to {output_path.name}\n")
 
+    return DatasetPlan(lookups, write_results)
 
-def process_tokyo_shops(
-    session: requests.Session,
-    api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
-    *,
-    throttle: float,
-) -> None:
+
+def plan_tokyo_shops() -> DatasetPlan:
     def shop_extractor(data):
         for municipality in data.get("data", []):
             municipality_name = municipality.get("municipalityName", "Unknown")
@@ -451,16 +1060,23 @@ def process_tokyo_shops(
         return (shop.get("name") or "").strip()
 
     def query_builder(name, shop):
-        address = (shop.get("details", {}).get("住所") or "").strip()
+        address = _usable_address(shop.get("details", {}).get("住所"))
         if address:
             return f"{name} {address}"
         return name
 
+    def bias_area_builder(shop, municipality_name):
+        # A name-only query could match a namesake anywhere; keep it near the shop's ward.
+        # Queries that include the address don't need the extra lookup.
+        if _usable_address(shop.get("details", {}).get("住所")):
+            return None
+        return municipality_name if municipality_name != "Unknown" else None
+
     def coord_setter(shop, coords):
         if coords:
-            shop["latitude"] = coords["lat"]
-            shop["longitude"] = coords["lng"]
-            place_id = coords.get("place_id")
+            shop["latitude"] = coords.lat
+            shop["longitude"] = coords.lng
+            place_id = coords.place_id
             if place_id:
                 shop["googlePlaceId"] = place_id
             else:
@@ -470,8 +1086,7 @@ def process_tokyo_shops(
             shop.pop("longitude", None)
             shop.pop("googlePlaceId", None)
 
-    process_shops(
-        session, api_key, cache,
+    return plan_shops(
         input_filename="tokyo_shops.json",
         output_filename="tokyo_shops_geocoded.json",
         city_name="Tokyo",
@@ -479,17 +1094,11 @@ def process_tokyo_shops(
         name_extractor=name_extractor,
         query_builder=query_builder,
         coord_setter=coord_setter,
-        throttle=throttle,
+        bias_area_builder=bias_area_builder,
     )
 
 
-def process_kyoto_shops(
-    session: requests.Session,
-    api_key: str,
-    cache: Dict[str, Optional[Dict[str, Any]]],
-    *,
-    throttle: float,
-) -> None:
+def plan_kyoto_shops() -> DatasetPlan:
     def shop_extractor(data):
         for shop in data:
             yield shop, None  # No grouping for Kyoto
@@ -507,9 +1116,9 @@ def process_kyoto_shops(
 
     def coord_setter(shop, coords):
         if coords:
-            shop["Latitude"] = coords["lat"]
-            shop["Longitude"] = coords["lng"]
-            place_id = coords.get("place_id")
+            shop["Latitude"] = coords.lat
+            shop["Longitude"] = coords.lng
+            place_id = coords.place_id
             if place_id:
                 shop["GooglePlaceId"] = place_id
             else:
@@ -519,8 +1128,7 @@ def process_kyoto_shops(
             shop.pop("Longitude", None)
             shop.pop("GooglePlaceId", None)
 
-    process_shops(
-        session, api_key, cache,
+    return plan_shops(
         input_filename="kyoto_shops.json",
         output_filename="kyoto_shops_geocoded.json",
         city_name="Kyoto",
@@ -528,7 +1136,6 @@ def process_kyoto_shops(
         name_extractor=name_extractor,
         query_builder=query_builder,
         coord_setter=coord_setter,
-        throttle=throttle,
     )
 
 
@@ -545,13 +1152,41 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         "--cache",
         type=Path,
         default=DEFAULT_CACHE_PATH,
-        help=f"Path to persistent cache file (default: {DEFAULT_CACHE_PATH})",
+        help=f"Path to persistent cache file; a .gz suffix stores it gzip-compressed (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--pretty-cache",
+        action="store_true",
+        help="Write the cache file as sorted, indented JSON (slower, but diff-friendly)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        type=Path,
+        default=DEFAULT_HTTP_CACHE_PATH,
+        help=f"Path to the HTTP response cache, used if requests-cache is installed (default: {DEFAULT_HTTP_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--no-http-cache",
+        action="store_true",
+        help="Disable the HTTP response cache",
     )
     parser.add_argument(
         "--throttle",
         type=float,
         default=0.25,
-        help="Seconds to sleep between requests (default: 0.25)",
+        help="Minimum seconds between requests to each API across all workers (default: 0.25)",
+    )
+    parser.add_argument(
+        "--burst",
+        type=int,
+        default=1,
+        help="Requests each API may start back-to-back after being idle (default: 1)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent API requests (default: {DEFAULT_WORKERS})",
     )
     parser.add_argument(
         "--skip-restaurants",
@@ -573,6 +1208,17 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="[Deprecated] Same as --skip-tokyo-shops",
     )
+    parser.add_argument(
+        "--refresh-missing-place-id",
+        action="store_true",
+        help="Re-query cached addresses that have coordinates but no Place ID",
+    )
+    parser.add_argument(
+        "--negative-ttl-days",
+        type=float,
+        default=DEFAULT_NEGATIVE_TTL_DAYS,
+        help=f"Re-query lookups that found nothing after this many days (default: {DEFAULT_NEGATIVE_TTL_DAYS})",
+    )
     parser.add_argument(
         "--force-refresh",
         action="store_true",
@@ -591,27 +1237,62 @@ def main(argv: Optional[list[str]] = None) -> int:
     print("=" * 70)
     print("🗺️  Google Maps Geocoding Script")
     print("=" * 70)
+    http_cache = None if args.no_http_cache or args.force_refresh else args.http_cache
+    if requests_cache is None:
+        http_cache = None
+
     print(f"Cache file: {args.cache}")
-    print(f"Throttle: {args.throttle}s between requests")
+    print(f"HTTP cache: {http_cache or 'disabled'}")
+    print(f"Throttle: {args.throttle}s between requests per API (burst {args.burst})")
+    print(f"Workers: {args.workers}")
     print("=" * 70)
 
-    session = requests.Session()
-    cache_before = load_cache(args.cache)
+    negative_ttl = args.negative_ttl_days * 24 * 3600
+    # Expired misses must reach the API again, not a replayed HTTP response.
+    session = create_session(
+        http_cache,
+        workers=args.workers,
+        limiter=RateLimiter(args.throttle, burst=args.burst),
+        expire_after=min(HTTP_CACHE_EXPIRE_SECONDS, negative_ttl),
+    )
+    cache_before = load_cache(args.cache, negative_ttl=negative_ttl)
     cache_entries_before = len(cache_before)
+    journal = journal_path(args.cache)
+    if journal.exists() and journal.stat().st_size:
+        # A previous run was interrupted; fold what it paid for into the snapshot now
+        # rather than leaving it only in the journal until this run finishes.
+        print(f"Recovered lookups from {journal.name}; updating {args.cache.name}")
+        save_cache(args.cache, cache_before, pretty=args.pretty_cache)
+    cache_before.journal = CacheJournal(journal)
 
     try:
         if args.force_refresh:
             print("⚠️  Force refresh enabled - will ignore cache and re-geocode all entries\n")
             cache_before.clear()
 
+        # Plan every dataset first so their lookups are resolved as one batch.
+        plans: List[DatasetPlan] = []
         if not args.skip_restaurants:
-            process_restaurants(session, args.api_key, cache_before, throttle=args.throttle)
+            plans.append(plan_restaurants())
         if not (args.skip_tokyo_shops or args.skip_shops):
-            process_tokyo_shops(session, args.api_key, cache_before, throttle=args.throttle)
+            plans.append(plan_tokyo_shops())
         if not args.skip_kyoto_shops:
-            process_kyoto_shops(session, args.api_key, cache_before, throttle=args.throttle)
+            plans.append(plan_kyoto_shops())
+
+        print(f"\n🔎 Resolving {sum(len(plan.lookups) for plan in plans)} lookups")
+        run_plans(
+            plans,
+            session,
+            args.api_key,
+            cache_before,
+            workers=args.workers,
+            refresh_missing_place_id=args.refresh_missing_place_id,
+        )
     finally:
-        save_cache(args.cache, cache_before)
+        cache_before.journal.close()
+        # Skip rewriting an unchanged cache, unless it is stored in the other layout.
+        if cache_before.dirty or cache_before.pretty not in (None, args.pretty_cache):
+            save_cache(args.cache, cache_before, pretty=args.pretty_cache)
         cache_entries_after = len(cache_before)
 
     print("=" * 70)